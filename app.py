@@ -1,5 +1,10 @@
 import sqlite3
 import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 from functools import wraps
 from datetime import datetime, date, timezone, timedelta
 from flask import (
@@ -39,6 +44,19 @@ THESIS_TRANSITIONS = {
     "Cancelled":           [],
 }
 
+# Status chains the seeder walks to give demo theses a realistic history
+# (Draft is implicit as the starting point of every chain).
+TRANSITIONS_PATH = {
+    "Draft": (),
+    "Submitted": ("Submitted",),
+    "UnderReview": ("Submitted", "UnderReview"),
+    "ExternallyReviewed": ("Submitted", "ExternallyReviewed"),
+    "RevisionRequested": ("Submitted", "UnderReview", "RevisionRequested"),
+    "Approved": ("Submitted", "UnderReview", "Approved"),
+    "FinalSubmitted": ("Submitted", "UnderReview", "Approved", "FinalSubmitted"),
+    "Completed": ("Submitted", "UnderReview", "Approved", "FinalSubmitted", "Completed"),
+}
+
 COMMITTEE_DECISIONS = ["Approve", "Reject", "Minor Revision"]
 
 MILESTONE_STATUSES = ["Planned", "InProgress", "Submitted", "Accepted"]
@@ -52,6 +70,13 @@ MILESTONE_TRANSITIONS = {
 
 SUBMISSION_KINDS = ["proposal", "interim", "final"]
 
+# Frozenset mirrors of the ordered lists above: the lists drive template
+# iteration, the sets give O(1) membership checks on validation paths.
+THESIS_STATUSES_SET = frozenset(THESIS_STATUSES)
+COMMITTEE_DECISIONS_SET = frozenset(COMMITTEE_DECISIONS)
+MILESTONE_STATUSES_SET = frozenset(MILESTONE_STATUSES)
+SUBMISSION_KINDS_SET = frozenset(SUBMISSION_KINDS)
+
 # ---------------------------------------------------------------------------
 # Thesis status classification for dashboards (Part D)
 # ---------------------------------------------------------------------------
@@ -60,6 +85,22 @@ ONGOING_STATUSES = {"Draft", "Submitted", "UnderReview", "ExternallyReviewed",
 TERMINATED_STATUSES = {"Approved", "FinalSubmitted", "Completed"}
 STOPPED_STATUSES = {"Cancelled"}
 
+# Statuses a thesis can never leave for "Late". The SQL fragment and the
+# overdue predicate are generated from the set once at import time so the
+# Python constant and the SQL can't drift apart.
+NON_LATE_TERMINAL = {"Approved", "FinalSubmitted", "Completed", "Late"}
+_NON_LATE_TERMINAL_SQL = ",".join(f"'{s}'" for s in sorted(NON_LATE_TERMINAL))
+OVERDUE_PREDICATE = (
+    "submission_deadline IS NOT NULL AND submission_deadline < ? "
+    f"AND status NOT IN ({_NON_LATE_TERMINAL_SQL})"
+)
+# Partial index matching OVERDUE_PREDICATE textually so the deadline sweep
+# scans only rows that could still go Late.
+_CREATE_OVERDUE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_thesis_overdue ON thesis(submission_deadline) "
+    f"WHERE status NOT IN ({_NON_LATE_TERMINAL_SQL})"
+)
+
 # ---------------------------------------------------------------------------
 # Topic taxonomy (30 topics from ONGOING3 workbook)
 # ---------------------------------------------------------------------------
@@ -82,37 +123,123 @@ TOPIC_TAXONOMY = [
 # ---------------------------------------------------------------------------
 # Database helpers
 # ---------------------------------------------------------------------------
+def _apply_pragmas(db):
+    """Per-connection SQLite tuning: WAL keeps readers unblocked during
+    writes, synchronous=NORMAL drops the per-commit fsync (safe under WAL),
+    and the rest enlarge the page cache / enable mmap I/O."""
+    db.execute("PRAGMA journal_mode = WAL")
+    db.execute("PRAGMA synchronous = NORMAL")
+    db.execute("PRAGMA temp_store = MEMORY")
+    db.execute("PRAGMA cache_size = -20000")
+    db.execute("PRAGMA mmap_size = 134217728")
+    db.execute("PRAGMA busy_timeout = 5000")
+    db.execute("PRAGMA foreign_keys = ON")
+
+
+# Pool of pre-configured connections so each request skips the VFS open
+# and per-connection PRAGMA setup. Connections are handed out per request
+# (never shared concurrently), so check_same_thread can be off.
+POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+_pool = queue.Queue(maxsize=POOL_SIZE)
+
+
+def _new_connection():
+    # isolation_level=None puts the driver in autocommit mode: single
+    # statements commit themselves and multi-statement handlers take an
+    # explicit transaction via tx() below, instead of the implicit-BEGIN
+    # guessing the default isolation level does around DML.
+    # cached_statements above the default 128 so the app's full set of
+    # prepared statements stays resident for the life of a pooled connection.
+    db = sqlite3.connect(DATABASE, isolation_level=None, check_same_thread=False,
+                         cached_statements=256)
+    db.row_factory = sqlite3.Row
+    _apply_pragmas(db)
+    return db
+
+
+@contextmanager
+def tx(db):
+    """Run a block of statements as one BEGIN IMMEDIATE .. COMMIT."""
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+
+
 def get_db():
     if "db" not in g:
-        g.db = sqlite3.connect(DATABASE)
-        g.db.row_factory = sqlite3.Row
-        g.db.execute("PRAGMA foreign_keys = ON")
+        try:
+            g.db = _pool.get_nowait()
+        except queue.Empty:
+            g.db = _new_connection()
     return g.db
 
 
+# Reference tables (students, supervisors, reviewers, committee members)
+# change rarely — seed data plus the occasional admin edit — so a short TTL
+# cache lets most form/detail requests skip SQLite for them. Rows are stored
+# as plain dicts so the cache never holds Row objects tied to a connection.
+_REFLIST_TTL = 30  # seconds
+_reflist_cache = {}
+
+
+def get_reflist(db, name, sql):
+    """Return the rows for a reference-list query, cached for _REFLIST_TTL."""
+    entry = _reflist_cache.get(name)
+    now = time.monotonic()
+    if entry and now - entry[0] < _REFLIST_TTL:
+        return entry[1]
+    rows = [dict(r) for r in db.execute(sql).fetchall()]
+    _reflist_cache[name] = (now, rows)
+    return rows
+
+
+# Statements shared by several handlers live at module scope so each
+# execute() hands sqlite3's per-connection statement cache the exact same
+# string object and the prepared plan is reused.
+SQL_UPDATE_THESIS_STATUS = "UPDATE thesis SET status=?, updated_at=? WHERE thesis_id=?"
+SQL_INSERT_THESIS_COMMITTEE = (
+    "INSERT INTO thesis_committee (thesis_id, committee_member_id) VALUES (?, ?)"
+)
+SQL_DELETE_THESIS_COMMITTEE = (
+    "DELETE FROM thesis_committee WHERE thesis_id = ? AND committee_member_id = ?"
+)
+
+
 @app.teardown_appcontext
 def close_db(exc):
     db = g.pop("db", None)
-    if db is not None:
+    if db is None:
+        return
+    try:
+        db.rollback()  # drop any transaction state left by a failed request
+        # Cheap no-op unless stats have gone stale; keeps sqlite_stat1 fresh
+        # so the planner keeps picking the partial/covering indexes.
+        db.execute("PRAGMA optimize")
+        _pool.put_nowait(db)
+    except (queue.Full, sqlite3.Error):
         db.close()
 
 
 def init_db():
-    db = sqlite3.connect(DATABASE)
-    db.execute("PRAGMA foreign_keys = ON")
+    db = sqlite3.connect(DATABASE, isolation_level=None)
+    # Only effective before the first table is created; aligns SQLite pages
+    # with the filesystem block size for new databases.
+    db.execute("PRAGMA page_size=4096")
+    _apply_pragmas(db)
     db.executescript(SCHEMA)
-    db.commit()
+    db.execute(_CREATE_OVERDUE_INDEX)
+    db.execute("ANALYZE")
     db.close()
 
 
 def migrate_db():
     """Add columns/tables that may be missing from an older schema."""
-    db = sqlite3.connect(DATABASE)
-    cols = [row[1] for row in db.execute("PRAGMA table_info(thesis)").fetchall()]
-    if "external_reviewer_id" not in cols:
-        db.execute("ALTER TABLE thesis ADD COLUMN external_reviewer_id INTEGER REFERENCES external_reviewer(id)")
-    if "submission_deadline" not in cols:
-        db.execute("ALTER TABLE thesis ADD COLUMN submission_deadline TEXT")
+    db = sqlite3.connect(DATABASE, isolation_level=None)
+    _apply_pragmas(db)
     # Ensure new tables exist (idempotent via IF NOT EXISTS in SCHEMA, but
     # re-run the full schema script to pick up any new CREATE TABLE statements)
     db.executescript("""
@@ -197,78 +324,108 @@ def migrate_db():
             added_at    TEXT NOT NULL,
             UNIQUE(proposal_id, round_id)
         );
+        CREATE TABLE IF NOT EXISTS topics (
+            id   INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL
+        );
     """)
-    # Migrate bids: add round_id column if missing, backfill with most recent round
-    bid_cols = [row[1] for row in db.execute("PRAGMA table_info(bids)").fetchall()]
-    if "round_id" not in bid_cols:
-        db.execute("ALTER TABLE bids ADD COLUMN round_id INTEGER REFERENCES bidding_rounds(id)")
-        fallback_round = db.execute(
-            "SELECT id FROM bidding_rounds ORDER BY "
-            "CASE status WHEN 'Open' THEN 0 WHEN 'Closed' THEN 1 ELSE 2 END, "
-            "created_at DESC LIMIT 1"
-        ).fetchone()
-        if fallback_round:
-            db.execute("UPDATE bids SET round_id = ? WHERE round_id IS NULL", (fallback_round[0],))
-    if "status" not in bid_cols:
-        db.execute("ALTER TABLE bids ADD COLUMN status TEXT NOT NULL DEFAULT 'Pending'")
-    if "rank" not in bid_cols:
-        db.execute("ALTER TABLE bids ADD COLUMN rank INTEGER NOT NULL DEFAULT 1")
-    if "bid_group_id" not in bid_cols:
-        db.execute("ALTER TABLE bids ADD COLUMN bid_group_id INTEGER REFERENCES bid_groups(id)")
-
-    # Ensure bid_groups table exists
-    db.execute("""CREATE TABLE IF NOT EXISTS bid_groups (
-        id         INTEGER PRIMARY KEY AUTOINCREMENT,
-        student_id INTEGER NOT NULL REFERENCES users(id),
-        round_id   INTEGER NOT NULL REFERENCES bidding_rounds(id),
-        status     TEXT NOT NULL DEFAULT 'Pending' CHECK(status IN ('Pending','Assigned','Rejected')),
-        motivation_text TEXT NOT NULL,
-        created_at TEXT NOT NULL,
-        UNIQUE(round_id, student_id)
-    )""")
-
-    # Migrate thesis: add ER-6 columns
-    thesis_cols = [row[1] for row in db.execute("PRAGMA table_info(thesis)").fetchall()]
-    new_thesis_cols = [
-        ("is_challenging", "INTEGER DEFAULT 0"),
-        ("is_external", "INTEGER DEFAULT 0"),
-        ("external_supervisor_name", "TEXT"),
-        ("additional_supervisor_id", "INTEGER"),
-        ("primary_topic", "TEXT"),
-        ("secondary_topic", "TEXT"),
-        ("start_date", "TEXT"),
-        ("expected_end", "TEXT"),
-        ("terminated_at", "TEXT"),
-        ("three_month_review_done", "INTEGER DEFAULT 0"),
-        ("assignment_source", "TEXT"),
-        ("notes", "TEXT"),
-        ("reviewer_id", "INTEGER"),
-    ]
-    for col_name, col_type in new_thesis_cols:
-        if col_name not in thesis_cols:
-            db.execute(f"ALTER TABLE thesis ADD COLUMN {col_name} {col_type}")
-
-    # Migrate users: add password_hash
-    user_cols = [row[1] for row in db.execute("PRAGMA table_info(users)").fetchall()]
-    if "password_hash" not in user_cols:
-        db.execute("ALTER TABLE users ADD COLUMN password_hash TEXT")
-
-    # Ensure topics table exists and is seeded
-    db.execute("""CREATE TABLE IF NOT EXISTS topics (
-        id   INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT UNIQUE NOT NULL
-    )""")
-    existing_topics = db.execute("SELECT COUNT(*) FROM topics").fetchone()[0]
-    if existing_topics == 0:
-        for topic in TOPIC_TAXONOMY:
-            db.execute("INSERT OR IGNORE INTO topics (name) VALUES (?)", (topic,))
-
-    # Migrate bidding_rounds: add proposal_collection_end
-    round_cols = [row[1] for row in db.execute("PRAGMA table_info(bidding_rounds)").fetchall()]
-    if "proposal_collection_end" not in round_cols:
-        db.execute("ALTER TABLE bidding_rounds ADD COLUMN proposal_collection_end TEXT")
-
-    db.commit()
+
+    def table_columns(table):
+        return {row[1] for row in db.execute(f"PRAGMA table_info({table})")}
+
+    # All column additions and backfills run in one explicit transaction:
+    # one commit and one fsync instead of autocommitting every ALTER.
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        thesis_cols = table_columns("thesis")
+        new_thesis_cols = [
+            ("external_reviewer_id", "INTEGER REFERENCES external_reviewer(id)"),
+            ("submission_deadline", "TEXT"),
+            # ER-6 columns
+            ("is_challenging", "INTEGER DEFAULT 0"),
+            ("is_external", "INTEGER DEFAULT 0"),
+            ("external_supervisor_name", "TEXT"),
+            ("additional_supervisor_id", "INTEGER"),
+            ("primary_topic", "TEXT"),
+            ("secondary_topic", "TEXT"),
+            ("start_date", "TEXT"),
+            ("expected_end", "TEXT"),
+            ("terminated_at", "TEXT"),
+            ("three_month_review_done", "INTEGER DEFAULT 0"),
+            ("assignment_source", "TEXT"),
+            ("notes", "TEXT"),
+            ("reviewer_id", "INTEGER"),
+        ]
+        for col_name, col_type in new_thesis_cols:
+            if col_name not in thesis_cols:
+                db.execute(f"ALTER TABLE thesis ADD COLUMN {col_name} {col_type}")
+
+        # Migrate bids: add round_id column if missing, backfill with most recent round
+        bid_cols = table_columns("bids")
+        if "round_id" not in bid_cols:
+            db.execute("ALTER TABLE bids ADD COLUMN round_id INTEGER REFERENCES bidding_rounds(id)")
+            fallback_round = db.execute(
+                "SELECT id FROM bidding_rounds ORDER BY "
+                "CASE status WHEN 'Open' THEN 0 WHEN 'Closed' THEN 1 ELSE 2 END, "
+                "created_at DESC LIMIT 1"
+            ).fetchone()
+            if fallback_round:
+                db.execute("UPDATE bids SET round_id = ? WHERE round_id IS NULL", (fallback_round[0],))
+        if "status" not in bid_cols:
+            db.execute("ALTER TABLE bids ADD COLUMN status TEXT NOT NULL DEFAULT 'Pending'")
+        if "rank" not in bid_cols:
+            db.execute("ALTER TABLE bids ADD COLUMN rank INTEGER NOT NULL DEFAULT 1")
+        if "bid_group_id" not in bid_cols:
+            db.execute("ALTER TABLE bids ADD COLUMN bid_group_id INTEGER REFERENCES bid_groups(id)")
+
+        # Migrate users: add password_hash
+        if "password_hash" not in table_columns("users"):
+            db.execute("ALTER TABLE users ADD COLUMN password_hash TEXT")
+
+        # Migrate bidding_rounds: add proposal_collection_end
+        if "proposal_collection_end" not in table_columns("bidding_rounds"):
+            db.execute("ALTER TABLE bidding_rounds ADD COLUMN proposal_collection_end TEXT")
+
+        # Seed the topic taxonomy on first run
+        if db.execute("SELECT COUNT(*) FROM topics").fetchone()[0] == 0:
+            db.executemany("INSERT OR IGNORE INTO topics (name) VALUES (?)",
+                           [(topic,) for topic in TOPIC_TAXONOMY])
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+
+    # Indexes for foreign keys and ORDER BY columns (idempotent; mirrors SCHEMA)
+    db.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_thesis_status ON thesis(status);
+        DROP INDEX IF EXISTS idx_decision_log_thesis_member;
+        CREATE INDEX IF NOT EXISTS idx_decision_log_latest
+            ON decision_log(thesis_id, committee_member_id, created_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_milestone_thesis ON milestone(thesis_id, due_date);
+        CREATE INDEX IF NOT EXISTS idx_submission_thesis ON submission(thesis_id, submitted_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_status_history_thesis ON status_history(thesis_id, changed_at DESC);
+        CREATE TRIGGER IF NOT EXISTS trg_thesis_status_hist
+        AFTER UPDATE OF status ON thesis
+        FOR EACH ROW WHEN OLD.status IS NOT NEW.status
+        BEGIN
+            INSERT INTO status_history (thesis_id, old_status, new_status, changed_at)
+            VALUES (NEW.thesis_id, OLD.status, NEW.status, NEW.updated_at);
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_thesis_status_hist_ins
+        AFTER INSERT ON thesis
+        BEGIN
+            INSERT INTO status_history (thesis_id, old_status, new_status, changed_at)
+            VALUES (NEW.thesis_id, NULL, NEW.status, NEW.created_at);
+        END;
+        CREATE INDEX IF NOT EXISTS idx_decision_log_thesis ON decision_log(thesis_id, created_at DESC);
+        DROP INDEX IF EXISTS idx_thesis_updated_at;
+        CREATE INDEX IF NOT EXISTS idx_thesis_list_cover
+            ON thesis(updated_at DESC, status, student_id, supervisor_id, thesis_id, title, submission_deadline);
+        DROP INDEX IF EXISTS idx_thesis_deadline;
+        CREATE INDEX IF NOT EXISTS idx_thesis_committee_member ON thesis_committee(committee_member_id);
+    """)
+    db.execute(_CREATE_OVERDUE_INDEX)
+    db.execute("ANALYZE")
     db.close()
 
 
@@ -427,13 +584,50 @@ CREATE TABLE IF NOT EXISTS topics (
     id   INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT UNIQUE NOT NULL
 );
+
+CREATE INDEX IF NOT EXISTS idx_thesis_status ON thesis(status);
+CREATE INDEX IF NOT EXISTS idx_decision_log_latest
+    ON decision_log(thesis_id, committee_member_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_milestone_thesis ON milestone(thesis_id, due_date);
+CREATE INDEX IF NOT EXISTS idx_submission_thesis ON submission(thesis_id, submitted_at DESC);
+CREATE INDEX IF NOT EXISTS idx_status_history_thesis ON status_history(thesis_id, changed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_decision_log_thesis ON decision_log(thesis_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_thesis_list_cover
+    ON thesis(updated_at DESC, status, student_id, supervisor_id, thesis_id, title, submission_deadline);
+CREATE INDEX IF NOT EXISTS idx_thesis_committee_member ON thesis_committee(committee_member_id);
+
+-- History is written by triggers so no status change can ever miss it, and a
+-- set-based UPDATE produces one history row per affected thesis for free.
+CREATE TRIGGER IF NOT EXISTS trg_thesis_status_hist
+AFTER UPDATE OF status ON thesis
+FOR EACH ROW WHEN OLD.status IS NOT NEW.status
+BEGIN
+    INSERT INTO status_history (thesis_id, old_status, new_status, changed_at)
+    VALUES (NEW.thesis_id, OLD.status, NEW.status, NEW.updated_at);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_thesis_status_hist_ins
+AFTER INSERT ON thesis
+BEGIN
+    INSERT INTO status_history (thesis_id, old_status, new_status, changed_at)
+    VALUES (NEW.thesis_id, NULL, NEW.status, NEW.created_at);
+END;
 """
 
 # ---------------------------------------------------------------------------
 # Template helpers
 # ---------------------------------------------------------------------------
+def _now_iso():
+    """Current UTC time in the DB timestamp format, computed once per request."""
+    if "now_iso" not in g:
+        g.now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    return g.now_iso
+
+
 @app.context_processor
 def inject_helpers():
+    if "today_iso" not in g:
+        g.today_iso = date.today().isoformat()
     return dict(
         thesis_statuses=THESIS_STATUSES,
         thesis_transitions=THESIS_TRANSITIONS,
@@ -442,7 +636,7 @@ def inject_helpers():
         submission_kinds=SUBMISSION_KINDS,
         committee_decisions=COMMITTEE_DECISIONS,
         topic_taxonomy=TOPIC_TAXONOMY,
-        today=date.today().isoformat(),
+        today=g.today_iso,
         now=lambda: datetime.now(timezone.utc),
     )
 
@@ -694,29 +888,35 @@ def admin_panel():
 # ---------------------------------------------------------------------------
 # Auto-Late enforcement
 # ---------------------------------------------------------------------------
-NON_LATE_TERMINAL = {"Approved", "FinalSubmitted", "Completed", "Late"}
+# Deadlines only move at day granularity, so scanning at most once per
+# TTL per process is plenty; everything else skips the DB entirely.
+_DEADLINE_TTL = 60  # seconds
+_last_deadline_check = [0.0]
+
 
 @app.before_request
 def enforce_deadlines():
     """Mark overdue theses as Late automatically."""
+    if request.endpoint == "static" or request.method in ("HEAD", "OPTIONS"):
+        return
+    if time.monotonic() - _last_deadline_check[0] < _DEADLINE_TTL:
+        return
     db = get_db()
     today = date.today().isoformat()
-    overdue = db.execute(
-        "SELECT thesis_id, status FROM thesis "
-        "WHERE submission_deadline IS NOT NULL AND submission_deadline < ? "
-        "AND status NOT IN ('Approved','FinalSubmitted','Completed','Late')",
-        (today,),
-    ).fetchall()
-    if overdue:
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-        for t in overdue:
-            db.execute("UPDATE thesis SET status='Late', updated_at=? WHERE thesis_id=?",
-                       (now, t["thesis_id"]))
-            db.execute(
-                "INSERT INTO status_history (thesis_id, old_status, new_status, changed_at) "
-                "VALUES (?, ?, 'Late', ?)", (t["thesis_id"], t["status"], now),
-            )
-        db.commit()
+    # Cheap existence probe first; the common case is "nothing overdue".
+    any_overdue = db.execute(
+        f"SELECT EXISTS(SELECT 1 FROM thesis WHERE {OVERDUE_PREDICATE})", (today,)
+    ).fetchone()[0]
+    if not any_overdue:
+        _last_deadline_check[0] = time.monotonic()
+        return
+    now = _now_iso()
+    with tx(db):
+        db.execute(
+            f"UPDATE thesis SET status='Late', updated_at=? WHERE {OVERDUE_PREDICATE}",
+            (now, today),
+        )
+    _last_deadline_check[0] = time.monotonic()
 
 # ---------------------------------------------------------------------------
 # Routes – Dashboard (role-specific)
@@ -936,15 +1136,16 @@ def _admin_dashboard(user):
     ).fetchall()
     rounds = db.execute("SELECT * FROM bidding_rounds ORDER BY created_at DESC").fetchall()
     open_round = get_open_round()
-    # Reviewer assignment stats (Part A/B)
-    reviewer_assigned_count = db.execute(
-        "SELECT COUNT(*) AS c FROM thesis WHERE reviewer_id IS NOT NULL "
-        "AND status IN ('Draft','Submitted','UnderReview','ExternallyReviewed','RevisionRequested','Late')"
-    ).fetchone()["c"]
-    reviewer_missing_count = db.execute(
-        "SELECT COUNT(*) AS c FROM thesis WHERE reviewer_id IS NULL "
-        "AND status IN ('Draft','Submitted','UnderReview','ExternallyReviewed','RevisionRequested','Late')"
-    ).fetchone()["c"]
+    # Reviewer assignment stats (Part A/B) — one scan instead of one COUNT
+    # query per bucket
+    reviewer_counts = db.execute(
+        "SELECT SUM(CASE WHEN reviewer_id IS NOT NULL THEN 1 ELSE 0 END) AS assigned, "
+        "SUM(CASE WHEN reviewer_id IS NULL THEN 1 ELSE 0 END) AS missing "
+        "FROM thesis WHERE status IN "
+        "('Draft','Submitted','UnderReview','ExternallyReviewed','RevisionRequested','Late')"
+    ).fetchone()
+    reviewer_assigned_count = reviewer_counts["assigned"] or 0
+    reviewer_missing_count = reviewer_counts["missing"] or 0
     # Session phase
     round_phase = get_round_phase(open_round) if open_round else None
     # Faculty effort tables
@@ -994,19 +1195,27 @@ def _admin_dashboard(user):
 def thesis_list():
     db = get_db()
     status_filter = request.args.get("status", "")
+    # Project only what the template renders; with idx_thesis_list_cover the
+    # thesis side is an index-only scan, never touching the wide heap rows.
     query = (
-        "SELECT t.*, s.name AS student_name, "
+        "SELECT t.thesis_id, t.title, t.status, t.updated_at, t.submission_deadline, "
+        "s.name AS student_name, "
         "COALESCE(sup.name, '—') AS supervisor_name "
         "FROM thesis t "
         "JOIN student s ON t.student_id = s.student_id "
         "LEFT JOIN supervisor sup ON t.supervisor_id = sup.supervisor_id "
     )
     params = []
-    if status_filter and status_filter in THESIS_STATUSES:
+    if status_filter and status_filter in THESIS_STATUSES_SET:
         query += "WHERE t.status = ? "
         params.append(status_filter)
     query += "ORDER BY t.updated_at DESC"
-    theses = db.execute(query, params).fetchall()
+    cur = db.execute(query, params)
+    # Package rows as namedtuples: attribute access from the template loop
+    # is a slot lookup instead of sqlite3.Row's per-access name probe, which
+    # matters on this unbounded listing.
+    ThesisRow = namedtuple("ThesisRow", [d[0] for d in cur.description], rename=True)
+    theses = [ThesisRow._make(r) for r in cur.fetchall()]
     return render_template("thesis_list.html", theses=theses, status_filter=status_filter)
 
 
@@ -1014,10 +1223,10 @@ def thesis_list():
 @role_required("Professor")
 def thesis_create():
     db = get_db()
-    students = db.execute("SELECT * FROM student ORDER BY name").fetchall()
-    supervisors = db.execute("SELECT * FROM supervisor ORDER BY name").fetchall()
-    reviewers = db.execute("SELECT * FROM external_reviewer ORDER BY name").fetchall()
-    committee_members = db.execute("SELECT * FROM committee_member ORDER BY name").fetchall()
+    students = get_reflist(db, "student", "SELECT student_id, name, email FROM student ORDER BY name")
+    supervisors = get_reflist(db, "supervisor", "SELECT supervisor_id, name, email, department FROM supervisor ORDER BY name")
+    reviewers = get_reflist(db, "external_reviewer", "SELECT id, name, email FROM external_reviewer ORDER BY name")
+    committee_members = get_reflist(db, "committee_member", "SELECT id, name, email FROM committee_member ORDER BY name")
     if request.method == "POST":
         title = request.form.get("title", "").strip()
         abstract = request.form.get("abstract", "").strip()
@@ -1032,23 +1241,18 @@ def thesis_create():
                                    supervisors=supervisors, reviewers=reviewers,
                                    committee_members=committee_members, thesis=None,
                                    selected_committee_ids=[])
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-        cur = db.execute(
-            "INSERT INTO thesis (title, abstract, student_id, supervisor_id, "
-            "external_reviewer_id, submission_deadline, status, created_at, updated_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, 'Draft', ?, ?)",
-            (title, abstract, int(student_id), supervisor_id and int(supervisor_id),
-             external_reviewer_id and int(external_reviewer_id), submission_deadline, now, now),
-        )
-        thesis_id = cur.lastrowid
-        for cid in committee_ids:
-            db.execute("INSERT INTO thesis_committee (thesis_id, committee_member_id) VALUES (?, ?)",
-                       (thesis_id, int(cid)))
-        db.execute(
-            "INSERT INTO status_history (thesis_id, old_status, new_status, changed_at) "
-            "VALUES (?, NULL, 'Draft', ?)", (thesis_id, now),
-        )
-        db.commit()
+        now = _now_iso()
+        with tx(db):
+            cur = db.execute(
+                "INSERT INTO thesis (title, abstract, student_id, supervisor_id, "
+                "external_reviewer_id, submission_deadline, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'Draft', ?, ?)",
+                (title, abstract, int(student_id), supervisor_id and int(supervisor_id),
+                 external_reviewer_id and int(external_reviewer_id), submission_deadline, now, now),
+            )
+            thesis_id = cur.lastrowid
+            db.executemany(SQL_INSERT_THESIS_COMMITTEE,
+                           [(thesis_id, int(cid)) for cid in committee_ids])
         flash("Thesis created.", "success")
         return redirect(url_for("thesis_detail", thesis_id=thesis_id))
     return render_template("thesis_form.html", students=students,
@@ -1057,6 +1261,22 @@ def thesis_create():
                            selected_committee_ids=[])
 
 
+def _apply_committee_diff(db, thesis_id, committee_ids):
+    """Sync thesis_committee to the submitted member ids.
+
+    Writes only the rows that actually changed instead of deleting and
+    re-inserting the whole committee on every save.
+    """
+    existing = {r[0] for r in db.execute(
+        "SELECT committee_member_id FROM thesis_committee WHERE thesis_id = ?",
+        (thesis_id,))}
+    desired = {int(cid) for cid in committee_ids}
+    db.executemany(SQL_DELETE_THESIS_COMMITTEE,
+                   [(thesis_id, mid) for mid in existing - desired])
+    db.executemany(SQL_INSERT_THESIS_COMMITTEE,
+                   [(thesis_id, mid) for mid in desired - existing])
+
+
 def get_committee_approval_status(db, thesis_id):
     """Return (can_approve, reason, member_decisions).
 
@@ -1064,33 +1284,35 @@ def get_committee_approval_status(db, thesis_id):
         {id, name, email, decision, comment, created_at}
     where decision/comment/created_at may be None if the member hasn't decided yet.
     """
-    members = db.execute(
-        "SELECT cm.* FROM committee_member cm "
-        "JOIN thesis_committee tc ON cm.id = tc.committee_member_id "
-        "WHERE tc.thesis_id = ? ORDER BY cm.name", (thesis_id,)
+    # Single query: each member joined with their latest decision (if any),
+    # instead of one decision_log lookup per member.
+    rows = db.execute(
+        "SELECT cm.id, cm.name, cm.email, dl.decision, dl.comment, dl.created_at "
+        "FROM committee_member cm "
+        "JOIN thesis_committee tc ON tc.committee_member_id = cm.id "
+        "LEFT JOIN decision_log dl ON dl.id = ("
+        "  SELECT id FROM decision_log "
+        "  WHERE thesis_id = ? AND committee_member_id = cm.id "
+        "  ORDER BY created_at DESC, id DESC LIMIT 1) "
+        "WHERE tc.thesis_id = ? ORDER BY cm.name",
+        (thesis_id, thesis_id),
     ).fetchall()
-    if not members:
+    if not rows:
         return True, None, []
 
     member_decisions = []
     all_decided = True
     has_reject = False
-    for m in members:
-        latest = db.execute(
-            "SELECT decision, comment, created_at FROM decision_log "
-            "WHERE thesis_id = ? AND committee_member_id = ? "
-            "ORDER BY created_at DESC LIMIT 1",
-            (thesis_id, m["id"]),
-        ).fetchone()
-        md = {"id": m["id"], "name": m["name"], "email": m["email"],
-              "decision": latest["decision"] if latest else None,
-              "comment": latest["comment"] if latest else None,
-              "created_at": latest["created_at"] if latest else None}
-        if not latest:
+    for r in rows:
+        member_decisions.append({
+            "id": r["id"], "name": r["name"], "email": r["email"],
+            "decision": r["decision"], "comment": r["comment"],
+            "created_at": r["created_at"],
+        })
+        if r["decision"] is None:
             all_decided = False
-        elif latest["decision"] == "Reject":
+        elif r["decision"] == "Reject":
             has_reject = True
-        member_decisions.append(md)
 
     if not all_decided:
         return False, "All committee decisions must be submitted before approval.", member_decisions
@@ -1103,6 +1325,9 @@ def get_committee_approval_status(db, thesis_id):
 @login_required
 def thesis_detail(thesis_id):
     db = get_db()
+    # One read transaction for the whole page so every query sees the same
+    # snapshot and SQLite doesn't re-check the WAL between statements.
+    db.execute("BEGIN")
     thesis = db.execute(
         "SELECT t.*, s.name AS student_name, s.email AS student_email, "
         "sup.name AS supervisor_name, sup.email AS supervisor_email, sup.department, "
@@ -1114,6 +1339,7 @@ def thesis_detail(thesis_id):
         "WHERE t.thesis_id = ?", (thesis_id,)
     ).fetchone()
     if not thesis:
+        db.execute("COMMIT")
         abort(404)
     milestones = db.execute(
         "SELECT * FROM milestone WHERE thesis_id = ? ORDER BY due_date", (thesis_id,)
@@ -1124,14 +1350,12 @@ def thesis_detail(thesis_id):
     history = db.execute(
         "SELECT * FROM status_history WHERE thesis_id = ? ORDER BY changed_at DESC", (thesis_id,)
     ).fetchall()
-    supervisors = db.execute("SELECT * FROM supervisor ORDER BY name").fetchall()
-    reviewers = db.execute("SELECT * FROM external_reviewer ORDER BY name").fetchall()
-    all_committee = db.execute("SELECT * FROM committee_member ORDER BY name").fetchall()
-    assigned_committee_ids = [
-        r["committee_member_id"] for r in
-        db.execute("SELECT committee_member_id FROM thesis_committee WHERE thesis_id = ?", (thesis_id,)).fetchall()
-    ]
+    supervisors = get_reflist(db, "supervisor", "SELECT supervisor_id, name, email, department FROM supervisor ORDER BY name")
+    reviewers = get_reflist(db, "external_reviewer", "SELECT id, name, email FROM external_reviewer ORDER BY name")
+    all_committee = get_reflist(db, "committee_member", "SELECT id, name, email FROM committee_member ORDER BY name")
     can_approve, approve_reason, member_decisions = get_committee_approval_status(db, thesis_id)
+    # The approval query already joined thesis_committee — no separate fetch.
+    assigned_committee_ids = [m["id"] for m in member_decisions]
     decision_log = db.execute(
         "SELECT dl.*, cm.name AS member_name FROM decision_log dl "
         "JOIN committee_member cm ON dl.committee_member_id = cm.id "
@@ -1144,6 +1368,7 @@ def thesis_detail(thesis_id):
     if thesis["reviewer_id"] if "reviewer_id" in thesis.keys() else False:
         prof_reviewer = db.execute("SELECT * FROM users WHERE id = ?",
                                    (thesis["reviewer_id"],)).fetchone()
+    db.execute("COMMIT")
     return render_template("thesis_detail.html", thesis=thesis,
                            milestones=milestones, submissions=submissions,
                            history=history, supervisors=supervisors, reviewers=reviewers,
@@ -1162,10 +1387,10 @@ def thesis_edit(thesis_id):
     thesis = db.execute("SELECT * FROM thesis WHERE thesis_id = ?", (thesis_id,)).fetchone()
     if not thesis:
         abort(404)
-    students = db.execute("SELECT * FROM student ORDER BY name").fetchall()
-    supervisors = db.execute("SELECT * FROM supervisor ORDER BY name").fetchall()
-    reviewers = db.execute("SELECT * FROM external_reviewer ORDER BY name").fetchall()
-    committee_members = db.execute("SELECT * FROM committee_member ORDER BY name").fetchall()
+    students = get_reflist(db, "student", "SELECT student_id, name, email FROM student ORDER BY name")
+    supervisors = get_reflist(db, "supervisor", "SELECT supervisor_id, name, email, department FROM supervisor ORDER BY name")
+    reviewers = get_reflist(db, "external_reviewer", "SELECT id, name, email FROM external_reviewer ORDER BY name")
+    committee_members = get_reflist(db, "committee_member", "SELECT id, name, email FROM committee_member ORDER BY name")
     selected_committee_ids = [
         r["committee_member_id"] for r in
         db.execute("SELECT committee_member_id FROM thesis_committee WHERE thesis_id = ?", (thesis_id,)).fetchall()
@@ -1184,18 +1409,15 @@ def thesis_edit(thesis_id):
                                    supervisors=supervisors, reviewers=reviewers,
                                    committee_members=committee_members, thesis=thesis,
                                    selected_committee_ids=selected_committee_ids)
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-        db.execute(
-            "UPDATE thesis SET title=?, abstract=?, student_id=?, supervisor_id=?, "
-            "external_reviewer_id=?, submission_deadline=?, updated_at=? WHERE thesis_id=?",
-            (title, abstract, int(student_id), supervisor_id and int(supervisor_id),
-             external_reviewer_id and int(external_reviewer_id), submission_deadline, now, thesis_id),
-        )
-        db.execute("DELETE FROM thesis_committee WHERE thesis_id = ?", (thesis_id,))
-        for cid in committee_ids:
-            db.execute("INSERT INTO thesis_committee (thesis_id, committee_member_id) VALUES (?, ?)",
-                       (thesis_id, int(cid)))
-        db.commit()
+        now = _now_iso()
+        with tx(db):
+            db.execute(
+                "UPDATE thesis SET title=?, abstract=?, student_id=?, supervisor_id=?, "
+                "external_reviewer_id=?, submission_deadline=?, updated_at=? WHERE thesis_id=?",
+                (title, abstract, int(student_id), supervisor_id and int(supervisor_id),
+                 external_reviewer_id and int(external_reviewer_id), submission_deadline, now, thesis_id),
+            )
+            _apply_committee_diff(db, thesis_id, committee_ids)
         flash("Thesis updated.", "success")
         return redirect(url_for("thesis_detail", thesis_id=thesis_id))
     return render_template("thesis_form.html", students=students,
@@ -1209,7 +1431,6 @@ def thesis_edit(thesis_id):
 def thesis_delete(thesis_id):
     db = get_db()
     db.execute("DELETE FROM thesis WHERE thesis_id = ?", (thesis_id,))
-    db.commit()
     flash("Thesis deleted.", "success")
     return redirect(url_for("thesis_list"))
 
@@ -1234,14 +1455,9 @@ def thesis_transition(thesis_id):
         if not can_approve:
             flash(f"Cannot approve: {reason}", "danger")
             return redirect(url_for("thesis_detail", thesis_id=thesis_id))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-    db.execute("UPDATE thesis SET status=?, updated_at=? WHERE thesis_id=?",
-               (new_status, now, thesis_id))
-    db.execute(
-        "INSERT INTO status_history (thesis_id, old_status, new_status, changed_at) "
-        "VALUES (?, ?, ?, ?)", (thesis_id, thesis["status"], new_status, now),
-    )
-    db.commit()
+    now = _now_iso()
+    with tx(db):
+        db.execute(SQL_UPDATE_THESIS_STATUS, (new_status, now, thesis_id))
     flash(f"Status changed to {new_status}.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1251,10 +1467,9 @@ def thesis_transition(thesis_id):
 def thesis_assign_supervisor(thesis_id):
     db = get_db()
     supervisor_id = request.form.get("supervisor_id") or None
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute("UPDATE thesis SET supervisor_id=?, updated_at=? WHERE thesis_id=?",
                (supervisor_id and int(supervisor_id), now, thesis_id))
-    db.commit()
     flash("Supervisor assigned.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1282,10 +1497,9 @@ def thesis_assign_professor_reviewer(thesis_id):
         if thesis["additional_supervisor_id"] and thesis["additional_supervisor_id"] == reviewer_user_id:
             flash("Reviewer cannot be the same person as the additional supervisor.", "danger")
             return redirect(url_for("thesis_detail", thesis_id=thesis_id))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute("UPDATE thesis SET reviewer_id=?, updated_at=? WHERE thesis_id=?",
                (reviewer_user_id, now, thesis_id))
-    db.commit()
     flash("Professor reviewer assigned." if reviewer_user_id else "Professor reviewer removed.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1295,10 +1509,9 @@ def thesis_assign_professor_reviewer(thesis_id):
 def thesis_assign_reviewer(thesis_id):
     db = get_db()
     reviewer_id = request.form.get("external_reviewer_id") or None
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute("UPDATE thesis SET external_reviewer_id=?, updated_at=? WHERE thesis_id=?",
                (reviewer_id and int(reviewer_id), now, thesis_id))
-    db.commit()
     flash("External Reviewer assigned.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1308,13 +1521,10 @@ def thesis_assign_reviewer(thesis_id):
 def thesis_update_committee(thesis_id):
     db = get_db()
     committee_ids = request.form.getlist("committee_member_ids")
-    db.execute("DELETE FROM thesis_committee WHERE thesis_id = ?", (thesis_id,))
-    for cid in committee_ids:
-        db.execute("INSERT INTO thesis_committee (thesis_id, committee_member_id) VALUES (?, ?)",
-                   (thesis_id, int(cid)))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-    db.execute("UPDATE thesis SET updated_at=? WHERE thesis_id=?", (now, thesis_id))
-    db.commit()
+    now = _now_iso()
+    with tx(db):
+        _apply_committee_diff(db, thesis_id, committee_ids)
+        db.execute("UPDATE thesis SET updated_at=? WHERE thesis_id=?", (now, thesis_id))
     flash("Committee updated.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1326,23 +1536,22 @@ def committee_decision_submit(thesis_id):
     member_id = request.form.get("committee_member_id")
     decision = request.form.get("decision", "").strip()
     comment = request.form.get("comment", "").strip()
-    if not member_id or decision not in COMMITTEE_DECISIONS:
+    if not member_id or decision not in COMMITTEE_DECISIONS_SET:
         flash("Invalid decision submission.", "danger")
         return redirect(url_for("thesis_detail", thesis_id=thesis_id))
-    assigned = db.execute(
-        "SELECT 1 FROM thesis_committee WHERE thesis_id = ? AND committee_member_id = ?",
-        (thesis_id, int(member_id)),
-    ).fetchone()
-    if not assigned:
-        flash("This member is not on the committee for this thesis.", "danger")
-        return redirect(url_for("thesis_detail", thesis_id=thesis_id))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-    db.execute(
+    now = _now_iso()
+    # Assignment check folded into the INSERT: nothing is written unless the
+    # member sits on this thesis's committee, and rowcount tells us which.
+    cur = db.execute(
         "INSERT INTO decision_log (thesis_id, committee_member_id, decision, comment, created_at) "
-        "VALUES (?, ?, ?, ?, ?)",
-        (thesis_id, int(member_id), decision, comment or None, now),
+        "SELECT ?, ?, ?, ?, ? WHERE EXISTS ("
+        "    SELECT 1 FROM thesis_committee WHERE thesis_id = ? AND committee_member_id = ?)",
+        (thesis_id, int(member_id), decision, comment or None, now,
+         thesis_id, int(member_id)),
     )
-    db.commit()
+    if cur.rowcount == 0:
+        flash("This member is not on the committee for this thesis.", "danger")
+        return redirect(url_for("thesis_detail", thesis_id=thesis_id))
     flash(f"Decision '{decision}' recorded.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1363,7 +1572,6 @@ def milestone_add(thesis_id):
         "INSERT INTO milestone (thesis_id, type, due_date, status, notes) VALUES (?, ?, ?, 'Planned', ?)",
         (thesis_id, mtype, due_date, notes),
     )
-    db.commit()
     flash("Milestone added.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1385,7 +1593,6 @@ def milestone_edit(milestone_id):
         "UPDATE milestone SET type=?, due_date=?, notes=? WHERE milestone_id=?",
         (mtype, due_date, notes, milestone_id),
     )
-    db.commit()
     flash("Milestone updated.", "success")
     return redirect(url_for("thesis_detail", thesis_id=ms["thesis_id"]))
 
@@ -1398,7 +1605,6 @@ def milestone_delete(milestone_id):
     if not ms:
         abort(404)
     db.execute("DELETE FROM milestone WHERE milestone_id = ?", (milestone_id,))
-    db.commit()
     flash("Milestone deleted.", "success")
     return redirect(url_for("thesis_detail", thesis_id=ms["thesis_id"]))
 
@@ -1417,7 +1623,6 @@ def milestone_transition(milestone_id):
         return redirect(url_for("thesis_detail", thesis_id=ms["thesis_id"]))
     db.execute("UPDATE milestone SET status=? WHERE milestone_id=?",
                (new_status, milestone_id))
-    db.commit()
     flash(f"Milestone status changed to {new_status}.", "success")
     return redirect(url_for("thesis_detail", thesis_id=ms["thesis_id"]))
 
@@ -1431,16 +1636,15 @@ def submission_add(thesis_id):
     kind = request.form.get("kind", "").strip()
     comment = request.form.get("comment", "").strip()
     attachment = request.form.get("attachment_path_or_url", "").strip()
-    if kind not in SUBMISSION_KINDS:
+    if kind not in SUBMISSION_KINDS_SET:
         flash("Invalid submission kind.", "danger")
         return redirect(url_for("thesis_detail", thesis_id=thesis_id))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute(
         "INSERT INTO submission (thesis_id, kind, submitted_at, comment, attachment_path_or_url) "
         "VALUES (?, ?, ?, ?, ?)",
         (thesis_id, kind, now, comment, attachment or None),
     )
-    db.commit()
     flash("Submission added.", "success")
     return redirect(url_for("thesis_detail", thesis_id=thesis_id))
 
@@ -1485,14 +1689,13 @@ def proposal_create():
         if not title:
             flash("Title is required.", "danger")
             return render_template("proposal_form.html", proposal=None)
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        now = _now_iso()
         db = get_db()
         cur = db.execute(
             "INSERT INTO proposals (title, description, created_by_professor_id, status, created_at, updated_at) "
             "VALUES (?, ?, ?, 'Draft', ?, ?)",
             (title, description, user["id"], now, now),
         )
-        db.commit()
         flash("Proposal created as Draft.", "success")
         return redirect(url_for("proposal_detail", proposal_id=cur.lastrowid))
     return render_template("proposal_form.html", proposal=None)
@@ -1573,12 +1776,11 @@ def proposal_edit(proposal_id):
         if not title:
             flash("Title is required.", "danger")
             return render_template("proposal_form.html", proposal=proposal)
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        now = _now_iso()
         db.execute(
             "UPDATE proposals SET title=?, description=?, updated_at=? WHERE id=?",
             (title, description, now, proposal_id),
         )
-        db.commit()
         flash("Proposal updated.", "success")
         return redirect(url_for("proposal_detail", proposal_id=proposal_id))
     return render_template("proposal_form.html", proposal=proposal)
@@ -1598,9 +1800,8 @@ def proposal_publish(proposal_id):
     if proposal["status"] != "Draft":
         flash("Only Draft proposals can be published.", "danger")
         return redirect(url_for("proposal_detail", proposal_id=proposal_id))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute("UPDATE proposals SET status='Published', updated_at=? WHERE id=?", (now, proposal_id))
-    db.commit()
     flash("Proposal published.", "success")
     return redirect(url_for("proposal_detail", proposal_id=proposal_id))
 
@@ -1619,9 +1820,8 @@ def proposal_archive(proposal_id):
     if proposal["status"] != "Published":
         flash("Only Published proposals can be archived.", "danger")
         return redirect(url_for("proposal_detail", proposal_id=proposal_id))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute("UPDATE proposals SET status='Archived', updated_at=? WHERE id=?", (now, proposal_id))
-    db.commit()
     flash("Proposal archived.", "success")
     return redirect(url_for("proposal_detail", proposal_id=proposal_id))
 
@@ -1727,22 +1927,22 @@ def student_bidding():
             if not p:
                 flash("One or more selected proposals are not available.", "danger")
                 return redirect(url_for("student_bidding"))
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-        # Create bid group
-        bg_cur = db.execute(
-            "INSERT INTO bid_groups (student_id, round_id, status, motivation_text, created_at) "
-            "VALUES (?, ?, 'Pending', ?, ?)",
-            (user["id"], open_round["id"], motivation, now),
-        )
-        bg_id = bg_cur.lastrowid
-        # Create individual bids
-        for rank, pid in enumerate(choices, 1):
-            db.execute(
-                "INSERT INTO bids (bid_group_id, proposal_id, student_id, round_id, rank, "
-                "motivation_text, status, created_at) VALUES (?, ?, ?, ?, ?, ?, 'Pending', ?)",
-                (bg_id, pid, user["id"], open_round["id"], rank, motivation, now),
+        now = _now_iso()
+        with tx(db):
+            # Create bid group
+            bg_cur = db.execute(
+                "INSERT INTO bid_groups (student_id, round_id, status, motivation_text, created_at) "
+                "VALUES (?, ?, 'Pending', ?, ?)",
+                (user["id"], open_round["id"], motivation, now),
             )
-        db.commit()
+            bg_id = bg_cur.lastrowid
+            # Create individual bids
+            for rank, pid in enumerate(choices, 1):
+                db.execute(
+                    "INSERT INTO bids (bid_group_id, proposal_id, student_id, round_id, rank, "
+                    "motivation_text, status, created_at) VALUES (?, ?, ?, ?, ?, ?, 'Pending', ?)",
+                    (bg_id, pid, user["id"], open_round["id"], rank, motivation, now),
+                )
         flash("Your bidding choices have been submitted successfully!", "success")
         return redirect(url_for("student_bidding"))
 
@@ -1834,14 +2034,13 @@ def round_create():
             if proposal_collection_end < start_date or proposal_collection_end > end_date:
                 flash("Proposal collection end must be between start and end dates.", "danger")
                 return render_template("round_form.html")
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        now = _now_iso()
         db = get_db()
         db.execute(
             "INSERT INTO bidding_rounds (name, start_date, end_date, proposal_collection_end, status, created_at) "
             "VALUES (?, ?, ?, ?, 'Planned', ?)",
             (name, start_date, end_date, proposal_collection_end, now),
         )
-        db.commit()
         flash("Bidding round created as Planned.", "success")
         return redirect(url_for("bidding_governance"))
     return render_template("round_form.html")
@@ -1863,7 +2062,6 @@ def round_open(round_id):
         flash("Another round is already open. Close it first.", "danger")
         return redirect(url_for("bidding_governance"))
     db.execute("UPDATE bidding_rounds SET status='Open' WHERE id=?", (round_id,))
-    db.commit()
     flash("Bidding round opened.", "success")
     return redirect(url_for("bidding_governance"))
 
@@ -1879,7 +2077,6 @@ def round_close(round_id):
         flash("Only Open rounds can be closed.", "danger")
         return redirect(url_for("bidding_governance"))
     db.execute("UPDATE bidding_rounds SET status='Closed' WHERE id=?", (round_id,))
-    db.commit()
     flash("Bidding round closed.", "success")
     return redirect(url_for("bidding_governance"))
 
@@ -1997,67 +2194,63 @@ def round_assign(round_id, proposal_id):
     professor = db.execute(
         "SELECT * FROM users WHERE id = ?", (proposal["created_by_professor_id"],)
     ).fetchone()
-    # Find or create student record (lookup by email)
-    student_row = db.execute(
-        "SELECT student_id FROM student WHERE email = ?", (bid["student_email"],)
-    ).fetchone()
-    if student_row:
-        student_record_id = student_row["student_id"]
-    else:
-        cur = db.execute(
-            "INSERT INTO student (name, email) VALUES (?, ?)",
-            (bid["student_name"], bid["student_email"]),
+    with tx(db):
+        # Find or create student record (lookup by email)
+        student_row = db.execute(
+            "SELECT student_id FROM student WHERE email = ?", (bid["student_email"],)
+        ).fetchone()
+        if student_row:
+            student_record_id = student_row["student_id"]
+        else:
+            cur = db.execute(
+                "INSERT INTO student (name, email) VALUES (?, ?)",
+                (bid["student_name"], bid["student_email"]),
+            )
+            student_record_id = cur.lastrowid
+        # Find or create supervisor record (lookup by email)
+        supervisor_row = db.execute(
+            "SELECT supervisor_id FROM supervisor WHERE email = ?", (professor["email"],)
+        ).fetchone()
+        if supervisor_row:
+            supervisor_record_id = supervisor_row["supervisor_id"]
+        else:
+            cur = db.execute(
+                "INSERT INTO supervisor (name, email, department) VALUES (?, ?, ?)",
+                (professor["name"], professor["email"], "General"),
+            )
+            supervisor_record_id = cur.lastrowid
+        now = _now_iso()
+        today_str = date.today().isoformat()
+        # Create thesis with ER-6 fields
+        thesis_cur = db.execute(
+            "INSERT INTO thesis (title, abstract, student_id, supervisor_id, status, "
+            "start_date, assignment_source, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, 'Draft', ?, 'NEW', ?, ?)",
+            (proposal["title"], proposal["description"], student_record_id, supervisor_record_id,
+             today_str, now, now),
         )
-        student_record_id = cur.lastrowid
-    # Find or create supervisor record (lookup by email)
-    supervisor_row = db.execute(
-        "SELECT supervisor_id FROM supervisor WHERE email = ?", (professor["email"],)
-    ).fetchone()
-    if supervisor_row:
-        supervisor_record_id = supervisor_row["supervisor_id"]
-    else:
-        cur = db.execute(
-            "INSERT INTO supervisor (name, email, department) VALUES (?, ?, ?)",
-            (professor["name"], professor["email"], "General"),
+        thesis_id = thesis_cur.lastrowid
+        # Create assignment
+        db.execute(
+            "INSERT INTO assignments (round_id, proposal_id, bid_id, student_id, thesis_id, assigned_by, assigned_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (round_id, proposal_id, int(bid_id), bid["student_id"], thesis_id, admin_user["id"], now),
         )
-        supervisor_record_id = cur.lastrowid
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-    today_str = date.today().isoformat()
-    # Create thesis with ER-6 fields
-    thesis_cur = db.execute(
-        "INSERT INTO thesis (title, abstract, student_id, supervisor_id, status, "
-        "start_date, assignment_source, created_at, updated_at) "
-        "VALUES (?, ?, ?, ?, 'Draft', ?, 'NEW', ?, ?)",
-        (proposal["title"], proposal["description"], student_record_id, supervisor_record_id,
-         today_str, now, now),
-    )
-    thesis_id = thesis_cur.lastrowid
-    db.execute(
-        "INSERT INTO status_history (thesis_id, old_status, new_status, changed_at) "
-        "VALUES (?, NULL, 'Draft', ?)", (thesis_id, now),
-    )
-    # Create assignment
-    db.execute(
-        "INSERT INTO assignments (round_id, proposal_id, bid_id, student_id, thesis_id, assigned_by, assigned_at) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (round_id, proposal_id, int(bid_id), bid["student_id"], thesis_id, admin_user["id"], now),
-    )
-    # Mark winning bid as Accepted, competing bids as Rejected
-    db.execute("UPDATE bids SET status = 'Accepted' WHERE id = ?", (int(bid_id),))
-    db.execute(
-        "UPDATE bids SET status = 'Rejected' WHERE proposal_id = ? AND round_id = ? AND id != ?",
-        (proposal_id, round_id, int(bid_id)),
-    )
-    # If bid belongs to a bid_group, mark group as Assigned and other bids in group as Rejected
-    bid_row = db.execute("SELECT bid_group_id FROM bids WHERE id = ?", (int(bid_id),)).fetchone()
-    if bid_row and bid_row["bid_group_id"]:
-        bg_id = bid_row["bid_group_id"]
-        db.execute("UPDATE bid_groups SET status = 'Assigned' WHERE id = ?", (bg_id,))
+        # Mark winning bid as Accepted, competing bids as Rejected
+        db.execute("UPDATE bids SET status = 'Accepted' WHERE id = ?", (int(bid_id),))
         db.execute(
-            "UPDATE bids SET status = 'Rejected' WHERE bid_group_id = ? AND id != ?",
-            (bg_id, int(bid_id)),
+            "UPDATE bids SET status = 'Rejected' WHERE proposal_id = ? AND round_id = ? AND id != ?",
+            (proposal_id, round_id, int(bid_id)),
         )
-    db.commit()
+        # If bid belongs to a bid_group, mark group as Assigned and other bids in group as Rejected
+        bid_row = db.execute("SELECT bid_group_id FROM bids WHERE id = ?", (int(bid_id),)).fetchone()
+        if bid_row and bid_row["bid_group_id"]:
+            bg_id = bid_row["bid_group_id"]
+            db.execute("UPDATE bid_groups SET status = 'Assigned' WHERE id = ?", (bg_id,))
+            db.execute(
+                "UPDATE bids SET status = 'Rejected' WHERE bid_group_id = ? AND id != ?",
+                (bg_id, int(bid_id)),
+            )
     flash(f"Assigned '{proposal['title']}' to {bid['student_name']}. Thesis #{thesis_id} created.", "success")
     return redirect(url_for("round_assignments", round_id=round_id))
 
@@ -2074,9 +2267,9 @@ def round_reject_group(round_id, bid_group_id):
     if bg["status"] != "Pending":
         flash("This bid group has already been processed.", "danger")
         return redirect(url_for("round_assignments", round_id=round_id))
-    db.execute("UPDATE bid_groups SET status = 'Rejected' WHERE id = ?", (bid_group_id,))
-    db.execute("UPDATE bids SET status = 'Rejected' WHERE bid_group_id = ?", (bid_group_id,))
-    db.commit()
+    with tx(db):
+        db.execute("UPDATE bid_groups SET status = 'Rejected' WHERE id = ?", (bid_group_id,))
+        db.execute("UPDATE bids SET status = 'Rejected' WHERE bid_group_id = ?", (bid_group_id,))
     student = db.execute("SELECT name FROM users WHERE id = ?", (bg["student_id"],)).fetchone()
     flash(f"Rejected all bids from {student['name']}.", "success")
     return redirect(url_for("round_assignments", round_id=round_id))
@@ -2161,10 +2354,9 @@ def bidding_manage_add(proposal_id):
     if existing:
         flash("Proposal is already in this round.", "danger")
         return redirect(url_for("bidding_manage"))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute("INSERT INTO proposal_rounds (proposal_id, round_id, added_by, added_at) VALUES (?, ?, ?, ?)",
                (proposal_id, open_round["id"], user["id"], now))
-    db.commit()
     flash(f"'{proposal['title']}' added to {open_round['name']}.", "success")
     return redirect(url_for("bidding_manage"))
 
@@ -2188,7 +2380,6 @@ def bidding_manage_remove(proposal_id):
         return redirect(url_for("bidding_manage"))
     db.execute("DELETE FROM proposal_rounds WHERE proposal_id = ? AND round_id = ? AND added_by = ?",
                (proposal_id, open_round["id"], user["id"]))
-    db.commit()
     flash("Proposal removed from round.", "success")
     return redirect(url_for("bidding_manage"))
 
@@ -2221,10 +2412,9 @@ def admin_bidding_add(proposal_id):
     if existing:
         flash("Proposal is already in this round.", "danger")
         return redirect(url_for("bidding_governance"))
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    now = _now_iso()
     db.execute("INSERT INTO proposal_rounds (proposal_id, round_id, added_by, added_at) VALUES (?, ?, ?, ?)",
                (proposal_id, open_round["id"], user["id"], now))
-    db.commit()
     flash(f"Proposal added to {open_round['name']}.", "success")
     return redirect(url_for("bidding_governance"))
 
@@ -2244,7 +2434,6 @@ def admin_bidding_remove(proposal_id):
         return redirect(url_for("bidding_governance"))
     db.execute("DELETE FROM proposal_rounds WHERE proposal_id = ? AND round_id = ?",
                (proposal_id, open_round["id"]))
-    db.commit()
     flash("Proposal removed from round.", "success")
     return redirect(url_for("bidding_governance"))
 
@@ -2252,184 +2441,185 @@ def admin_bidding_remove(proposal_id):
 # ---------------------------------------------------------------------------
 # Seed data
 # ---------------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+# Static seed data (module-level so the literals are built once per process)
+# ---------------------------------------------------------------------------
+SEED_STUDENTS = (
+    ("Alice Johnson", "alice@university.edu"),
+    ("Bob Smith", "bob@university.edu"),
+    ("Carol Lee", "carol@university.edu"),
+    ("David Kim", "david@university.edu"),
+    ("Eva Martinez", "eva@university.edu"),
+)
+
+SEED_SUPERVISORS = (
+    ("Dr. Sarah Chen", "s.chen@university.edu", "Computer Science"),
+    ("Prof. Michael Brown", "m.brown@university.edu", "Data Science"),
+    ("Dr. Laura Wilson", "l.wilson@university.edu", "Information Systems"),
+)
+
+SEED_EXTERNAL_REVIEWERS = (
+    ("Dr. James Porter", "j.porter@review-board.org"),
+    ("Prof. Amina Yusuf", "a.yusuf@external-review.edu"),
+)
+
+SEED_COMMITTEE_MEMBERS = (
+    ("Dr. Helen Zhao", "h.zhao@university.edu"),
+    ("Prof. Robert Tanaka", "r.tanaka@university.edu"),
+    ("Dr. Fatima Al-Rashid", "f.alrashid@university.edu"),
+    ("Prof. Erik Johansson", "e.johansson@university.edu"),
+)
+
+# (thesis_id, type, due_date, status, notes)
+SEED_MILESTONES = (
+    # Thesis 1 (UnderReview)
+    (1, "Literature Review", "2026-02-01", "Submitted", "Comprehensive review completed"),
+    (1, "Methodology Design", "2026-03-15", "InProgress", "Designing experiment pipeline"),
+    (1, "Data Collection", "2026-05-01", "Planned", None),
+    (1, "Final Defense", "2026-08-01", "Planned", None),
+    # Thesis 2 (Approved)
+    (2, "Literature Review", "2026-01-15", "Accepted", "Approved by supervisor"),
+    (2, "Prototype Development", "2026-03-01", "Submitted", "Smart contract prototype ready"),
+    (2, "Testing & Evaluation", "2026-05-01", "Planned", None),
+)
+
+# Committee assignments: thesis 1 gets members 1, 2, 3; thesis 2 gets
+# members 1, 2 (both approved — thesis is Approved); thesis 4 gets 2, 4
+SEED_THESIS_COMMITTEE = ((1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (4, 2), (4, 4))
+
+# (title, abstract, student_id, supervisor_id, external_reviewer_id, submission_deadline, status,
+#  is_challenging, is_external, external_supervisor_name, primary_topic, secondary_topic,
+#  start_date, expected_end, terminated_at, three_month_review_done, assignment_source, notes)
+SEED_THESES = (
+    ("Machine Learning for Early Disease Detection",
+     "Using ML algorithms to detect diseases from medical imaging data.",
+     1, 1, 1, "2026-06-30", "ExternallyReviewed",
+     1, 1, "Dr. Marco Rossi", "Machine learning", "Image processing and computer vision",
+     "2025-09-01", "2026-06-30", None, 1, "OLD", None),
+    ("Blockchain-Based Academic Credential Verification",
+     "A decentralized system for verifying academic transcripts and diplomas.",
+     2, 2, None, "2026-08-15", "Approved",
+     1, 0, None, "Blockchain", "Computer Security",
+     "2025-06-01", "2026-08-15", "2026-02-20", 1, "OLD", None),
+    ("Natural Language Processing for Legal Documents",
+     "Automating analysis and summarization of legal contracts using NLP and transformer architectures.",
+     3, 3, None, "2026-09-01", "Draft",
+     0, 0, None, "Natural language processing", "Software engineering",
+     "2026-01-15", "2026-09-01", None, 0, "NEW", None),
+    ("IoT-Enabled Smart Campus Energy Management",
+     "Designing an IoT framework to optimize energy consumption across campus buildings.",
+     4, 1, 2, "2026-07-15", "Submitted",
+     1, 1, "Prof. Luigi Bianchi", "Internet of Things", "Distributed computing",
+     "2025-10-01", "2026-07-15", None, 1, "OLD", None),
+    ("Ethical AI: Bias Detection in Hiring Algorithms",
+     "Investigating and mitigating bias in AI-powered recruitment tools using fairness-aware ML.",
+     5, None, None, "2026-03-01", "RevisionRequested",
+     0, 0, None, "Machine learning", "Data protection and privacy",
+     "2025-11-01", "2026-03-01", None, 0, "NEW", None),
+)
+
+# (thesis_id, kind, comment, attachment) — submitted_at is filled at seed time
+SEED_SUBMISSIONS = (
+    (1, "proposal", "Initial proposal for ML disease detection research.", "https://docs.google.com/document/d/abc123"),
+    (1, "interim", "Interim report covering literature review and initial experiments.", None),
+    (2, "proposal", "Blockchain credential verification proposal.", "https://docs.google.com/document/d/def456"),
+    (4, "proposal", "IoT smart campus proposal with architecture diagrams.", "https://drive.google.com/file/d/ghi789"),
+)
+
+# Decision logs: thesis 1 members 1+2 approved (member 3 pending),
+# thesis 2 both members approved
+SEED_DECISIONS = (
+    (1, 1, "Approve", "Strong methodology and clear objectives."),
+    (1, 2, "Approve", "Good literature review. Approved."),
+    (2, 1, "Approve", "Excellent prototype."),
+    (2, 2, "Approve", "Solid technical foundation."),
+)
+
+# Multi-part seed INSERT statements as single module-level strings, so each
+# execute hands the statement cache one identical string object.
+SQL_SEED_THESIS_INSERT = (
+    "INSERT INTO thesis (title, abstract, student_id, supervisor_id, external_reviewer_id, "
+    "submission_deadline, status, is_challenging, is_external, external_supervisor_name, "
+    "primary_topic, secondary_topic, start_date, expected_end, terminated_at, "
+    "three_month_review_done, assignment_source, notes, created_at, updated_at) VALUES "
+)
+SQL_SEED_THESIS_ROW = "(?, ?, ?, ?, ?, ?, 'Draft', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+SQL_SEED_INSERT_MILESTONE = (
+    "INSERT INTO milestone (thesis_id, type, due_date, status, notes) VALUES (?, ?, ?, ?, ?)"
+)
+SQL_SEED_INSERT_SUBMISSION = (
+    "INSERT INTO submission (thesis_id, kind, submitted_at, comment, attachment_path_or_url) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+SQL_SEED_INSERT_DECISION = (
+    "INSERT INTO decision_log (thesis_id, committee_member_id, decision, comment, created_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
 def seed():
-    db = sqlite3.connect(DATABASE)
-    db.execute("PRAGMA foreign_keys = ON")
+    db = sqlite3.connect(DATABASE, isolation_level=None, cached_statements=256)
+    _apply_pragmas(db)
+    # One cursor for the whole seed: every batch binds through the same
+    # prepared-statement machinery instead of allocating a cursor per call.
+    cur = db.cursor()
 
-    existing = db.execute("SELECT COUNT(*) FROM student").fetchone()[0]
-    if existing > 0:
+    if cur.execute("SELECT 1 FROM student LIMIT 1").fetchone():
         db.close()
         return
 
-    students = [
-        ("Alice Johnson", "alice@university.edu"),
-        ("Bob Smith", "bob@university.edu"),
-        ("Carol Lee", "carol@university.edu"),
-        ("David Kim", "david@university.edu"),
-        ("Eva Martinez", "eva@university.edu"),
-    ]
-    for name, email in students:
-        db.execute("INSERT INTO student (name, email) VALUES (?, ?)", (name, email))
+    # One transaction for the whole seed: a single commit/fsync instead of
+    # the driver opening and closing implicit transactions around the inserts.
+    cur.execute("BEGIN IMMEDIATE")
 
-    supervisors = [
-        ("Dr. Sarah Chen", "s.chen@university.edu", "Computer Science"),
-        ("Prof. Michael Brown", "m.brown@university.edu", "Data Science"),
-        ("Dr. Laura Wilson", "l.wilson@university.edu", "Information Systems"),
-    ]
-    for name, email, dept in supervisors:
-        db.execute("INSERT INTO supervisor (name, email, department) VALUES (?, ?, ?)",
-                   (name, email, dept))
+    cur.executemany("INSERT INTO student (name, email) VALUES (?, ?)", SEED_STUDENTS)
 
-    external_reviewers = [
-        ("Dr. James Porter", "j.porter@review-board.org"),
-        ("Prof. Amina Yusuf", "a.yusuf@external-review.edu"),
-    ]
-    for name, email in external_reviewers:
-        db.execute("INSERT INTO external_reviewer (name, email) VALUES (?, ?)", (name, email))
-
-    committee_members = [
-        ("Dr. Helen Zhao", "h.zhao@university.edu"),
-        ("Prof. Robert Tanaka", "r.tanaka@university.edu"),
-        ("Dr. Fatima Al-Rashid", "f.alrashid@university.edu"),
-        ("Prof. Erik Johansson", "e.johansson@university.edu"),
-    ]
-    for name, email in committee_members:
-        db.execute("INSERT INTO committee_member (name, email) VALUES (?, ?)", (name, email))
+    cur.executemany("INSERT INTO supervisor (name, email, department) VALUES (?, ?, ?)",
+                    SEED_SUPERVISORS)
+
+    cur.executemany("INSERT INTO external_reviewer (name, email) VALUES (?, ?)",
+                    SEED_EXTERNAL_REVIEWERS)
+
+    cur.executemany("INSERT INTO committee_member (name, email) VALUES (?, ?)",
+                    SEED_COMMITTEE_MEMBERS)
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-    # (title, abstract, student_id, supervisor_id, external_reviewer_id, submission_deadline, status,
-    #  is_challenging, is_external, external_supervisor_name, primary_topic, secondary_topic,
-    #  start_date, expected_end, terminated_at, three_month_review_done, assignment_source, notes)
-    theses = [
-        ("Machine Learning for Early Disease Detection",
-         "Using ML algorithms to detect diseases from medical imaging data.",
-         1, 1, 1, "2026-06-30", "ExternallyReviewed",
-         1, 1, "Dr. Marco Rossi", "Machine learning", "Image processing and computer vision",
-         "2025-09-01", "2026-06-30", None, 1, "OLD", None),
-        ("Blockchain-Based Academic Credential Verification",
-         "A decentralized system for verifying academic transcripts and diplomas.",
-         2, 2, None, "2026-08-15", "Approved",
-         1, 0, None, "Blockchain", "Computer Security",
-         "2025-06-01", "2026-08-15", "2026-02-20", 1, "OLD", None),
-        ("Natural Language Processing for Legal Documents",
-         "Automating analysis and summarization of legal contracts using NLP and transformer architectures.",
-         3, 3, None, "2026-09-01", "Draft",
-         0, 0, None, "Natural language processing", "Software engineering",
-         "2026-01-15", "2026-09-01", None, 0, "NEW", None),
-        ("IoT-Enabled Smart Campus Energy Management",
-         "Designing an IoT framework to optimize energy consumption across campus buildings.",
-         4, 1, 2, "2026-07-15", "Submitted",
-         1, 1, "Prof. Luigi Bianchi", "Internet of Things", "Distributed computing",
-         "2025-10-01", "2026-07-15", None, 1, "OLD", None),
-        ("Ethical AI: Bias Detection in Hiring Algorithms",
-         "Investigating and mitigating bias in AI-powered recruitment tools using fairness-aware ML.",
-         5, None, None, "2026-03-01", "RevisionRequested",
-         0, 0, None, "Machine learning", "Data protection and privacy",
-         "2025-11-01", "2026-03-01", None, 0, "NEW", None),
-    ]
-    for (title, abstract, sid, supid, erid, deadline, status,
-         is_ch, is_ext, ext_sup, ptopic, stopic, sdate, edate, term_at,
-         three_m, asrc, notes) in theses:
-        cur = db.execute(
-            "INSERT INTO thesis (title, abstract, student_id, supervisor_id, external_reviewer_id, "
-            "submission_deadline, status, is_challenging, is_external, external_supervisor_name, "
-            "primary_topic, secondary_topic, start_date, expected_end, terminated_at, "
-            "three_month_review_done, assignment_source, notes, created_at, updated_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (title, abstract, sid, supid, erid, deadline, status,
-             is_ch, is_ext, ext_sup, ptopic, stopic, sdate, edate, term_at,
-             three_m, asrc, notes, now, now),
-        )
-        tid = cur.lastrowid
-        db.execute(
-            "INSERT INTO status_history (thesis_id, old_status, new_status, changed_at) "
-            "VALUES (?, NULL, 'Draft', ?)", (tid, now),
-        )
-        if status != "Draft":
-            transitions_path = {
-                "Submitted": ["Submitted"],
-                "UnderReview": ["Submitted", "UnderReview"],
-                "ExternallyReviewed": ["Submitted", "ExternallyReviewed"],
-                "RevisionRequested": ["Submitted", "UnderReview", "RevisionRequested"],
-                "Approved": ["Submitted", "UnderReview", "Approved"],
-                "FinalSubmitted": ["Submitted", "UnderReview", "Approved", "FinalSubmitted"],
-                "Completed": ["Submitted", "UnderReview", "Approved", "FinalSubmitted", "Completed"],
-            }
-            prev = "Draft"
-            for s in transitions_path.get(status, []):
-                db.execute(
-                    "INSERT INTO status_history (thesis_id, old_status, new_status, changed_at) "
-                    "VALUES (?, ?, ?, ?)", (tid, prev, s, now),
-                )
-                prev = s
-
-    # Milestones for thesis 1 (UnderReview)
-    milestones_t1 = [
-        (1, "Literature Review", "2026-02-01", "Submitted", "Comprehensive review completed"),
-        (1, "Methodology Design", "2026-03-15", "InProgress", "Designing experiment pipeline"),
-        (1, "Data Collection", "2026-05-01", "Planned", None),
-        (1, "Final Defense", "2026-08-01", "Planned", None),
-    ]
-    for tid, mtype, due, status, notes in milestones_t1:
-        db.execute(
-            "INSERT INTO milestone (thesis_id, type, due_date, status, notes) VALUES (?, ?, ?, ?, ?)",
-            (tid, mtype, due, status, notes),
-        )
+    # Insert every thesis as Draft, then walk each status chain with UPDATEs
+    # so the status_history triggers record the same transitions a live
+    # thesis would have gone through. On SQLite 3.35+ a single multi-VALUES
+    # INSERT ... RETURNING yields all the new ids at once; older versions
+    # fall back to per-row execute with lastrowid.
+    thesis_rows = [row[:6] + row[7:] + (now, now) for row in SEED_THESES]
+    if sqlite3.sqlite_version_info >= (3, 35):
+        sql = (SQL_SEED_THESIS_INSERT
+               + ", ".join([SQL_SEED_THESIS_ROW] * len(thesis_rows))
+               + " RETURNING thesis_id")
+        flat_params = [value for params in thesis_rows for value in params]
+        tids = [r[0] for r in cur.execute(sql, flat_params).fetchall()]
+    else:
+        tids = [cur.execute(SQL_SEED_THESIS_INSERT + SQL_SEED_THESIS_ROW, params).lastrowid
+                for params in thesis_rows]
+    status_steps = [(s, now, tid)
+                    for tid, row in zip(tids, SEED_THESES)
+                    for s in TRANSITIONS_PATH[row[6]]]
+    cur.executemany(SQL_UPDATE_THESIS_STATUS, status_steps)
 
-    # Milestones for thesis 2 (Approved)
-    milestones_t2 = [
-        (2, "Literature Review", "2026-01-15", "Accepted", "Approved by supervisor"),
-        (2, "Prototype Development", "2026-03-01", "Submitted", "Smart contract prototype ready"),
-        (2, "Testing & Evaluation", "2026-05-01", "Planned", None),
-    ]
-    for tid, mtype, due, status, notes in milestones_t2:
-        db.execute(
-            "INSERT INTO milestone (thesis_id, type, due_date, status, notes) VALUES (?, ?, ?, ?, ?)",
-            (tid, mtype, due, status, notes),
-        )
+    cur.executemany(SQL_SEED_INSERT_MILESTONE, SEED_MILESTONES)
 
-    # Submissions
-    submissions = [
-        (1, "proposal", now, "Initial proposal for ML disease detection research.", "https://docs.google.com/document/d/abc123"),
-        (1, "interim", now, "Interim report covering literature review and initial experiments.", None),
-        (2, "proposal", now, "Blockchain credential verification proposal.", "https://docs.google.com/document/d/def456"),
-        (4, "proposal", now, "IoT smart campus proposal with architecture diagrams.", "https://drive.google.com/file/d/ghi789"),
-    ]
-    for tid, kind, sub_at, comment, attachment in submissions:
-        db.execute(
-            "INSERT INTO submission (thesis_id, kind, submitted_at, comment, attachment_path_or_url) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (tid, kind, sub_at, comment, attachment),
-        )
+    cur.executemany(SQL_SEED_INSERT_SUBMISSION,
+                    [(tid, kind, now, comment, attachment)
+                     for tid, kind, comment, attachment in SEED_SUBMISSIONS])
+
+    cur.executemany(SQL_INSERT_THESIS_COMMITTEE, SEED_THESIS_COMMITTEE)
 
-    # Committee assignments
-    # Thesis 1: committee members 1, 2, 3
-    for cid in [1, 2, 3]:
-        db.execute("INSERT INTO thesis_committee (thesis_id, committee_member_id) VALUES (?, ?)", (1, cid))
-    # Thesis 2: committee members 1, 2 (both approved — thesis is Approved)
-    for cid in [1, 2]:
-        db.execute("INSERT INTO thesis_committee (thesis_id, committee_member_id) VALUES (?, ?)", (2, cid))
-    # Thesis 4: committee members 2, 4
-    for cid in [2, 4]:
-        db.execute("INSERT INTO thesis_committee (thesis_id, committee_member_id) VALUES (?, ?)", (4, cid))
-
-    # Decision logs
-    # Thesis 1: member 1 approved, member 2 approved, member 3 pending (no decision yet)
-    db.execute("INSERT INTO decision_log (thesis_id, committee_member_id, decision, comment, created_at) "
-               "VALUES (?, ?, ?, ?, ?)", (1, 1, "Approve", "Strong methodology and clear objectives.", now))
-    db.execute("INSERT INTO decision_log (thesis_id, committee_member_id, decision, comment, created_at) "
-               "VALUES (?, ?, ?, ?, ?)", (1, 2, "Approve", "Good literature review. Approved.", now))
-    # Thesis 2: both members approved
-    db.execute("INSERT INTO decision_log (thesis_id, committee_member_id, decision, comment, created_at) "
-               "VALUES (?, ?, ?, ?, ?)", (2, 1, "Approve", "Excellent prototype.", now))
-    db.execute("INSERT INTO decision_log (thesis_id, committee_member_id, decision, comment, created_at) "
-               "VALUES (?, ?, ?, ?, ?)", (2, 2, "Approve", "Solid technical foundation.", now))
+    cur.executemany(SQL_SEED_INSERT_DECISION,
+                    [row + (now,) for row in SEED_DECISIONS])
 
     # Seed topics
-    for topic in TOPIC_TAXONOMY:
-        db.execute("INSERT OR IGNORE INTO topics (name) VALUES (?)", (topic,))
+    cur.executemany("INSERT OR IGNORE INTO topics (name) VALUES (?)",
+                   [(topic,) for topic in TOPIC_TAXONOMY])
 
-    db.commit()
+    cur.execute("COMMIT")
     db.close()
 
 
@@ -2437,11 +2627,12 @@ def seed():
 # Seed users
 # ---------------------------------------------------------------------------
 def seed_users():
-    db = sqlite3.connect(DATABASE)
-    existing = db.execute("SELECT COUNT(*) FROM users").fetchone()[0]
-    if existing > 0:
+    db = sqlite3.connect(DATABASE, isolation_level=None)
+    _apply_pragmas(db)
+    if db.execute("SELECT 1 FROM users LIMIT 1").fetchone():
         db.close()
         return
+    db.execute("BEGIN IMMEDIATE")
     default_pw = generate_password_hash("password123")
     users = [
         ("Admin User", "admin@university.edu", "Admin"),
@@ -2455,7 +2646,7 @@ def seed_users():
     for name, email, role in users:
         db.execute("INSERT INTO users (name, email, role, password_hash) VALUES (?, ?, ?, ?)",
                    (name, email, role, default_pw))
-    db.commit()
+    db.execute("COMMIT")
     db.close()
 
 
@@ -2463,12 +2654,12 @@ def seed_users():
 # Seed proposals, rounds, bids
 # ---------------------------------------------------------------------------
 def seed_proposals():
-    db = sqlite3.connect(DATABASE)
-    db.execute("PRAGMA foreign_keys = ON")
-    existing = db.execute("SELECT COUNT(*) FROM proposals").fetchone()[0]
-    if existing > 0:
+    db = sqlite3.connect(DATABASE, isolation_level=None)
+    _apply_pragmas(db)
+    if db.execute("SELECT 1 FROM proposals LIMIT 1").fetchone():
         db.close()
         return
+    db.execute("BEGIN IMMEDIATE")
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
 
@@ -2587,10 +2778,6 @@ def seed_proposals():
          now, now),
     )
     assigned_thesis_id = thesis_cur.lastrowid
-    db.execute(
-        "INSERT INTO status_history (thesis_id, old_status, new_status, changed_at) "
-        "VALUES (?, NULL, 'Draft', ?)", (assigned_thesis_id, now),
-    )
 
     # Assignment record: round 1, proposal 1, bid 1 (Alice), admin (user 1)
     db.execute(
@@ -2630,27 +2817,62 @@ def seed_proposals():
             (pid, rid, uid, now),
         )
 
-    db.commit()
+    db.execute("COMMIT")
     db.close()
 
 
 # ---------------------------------------------------------------------------
 # Startup: ensure DB is ready (works under both gunicorn and direct run)
 # ---------------------------------------------------------------------------
+def _seed_all():
+    """Run migrations and demo seeding; assumes the schema already exists.
+
+    Only database-level failures are caught (and logged once); programming
+    errors propagate so a broken build fails fast instead of silently
+    re-running a doomed seed on every boot.
+    """
+    try:
+        migrate_db()
+        seed()
+        seed_users()
+        seed_proposals()
+    except sqlite3.DatabaseError:
+        app.logger.exception("Database migration/seeding failed")
+        raise
+
+
 def _startup():
-    """Initialise database, run migrations, and seed demo data."""
+    """Initialise the database and kick off migrations/seeding.
+
+    init_db runs synchronously so the schema exists before the first request;
+    the migrate/seed pass is deferred to a background thread (safe under WAL)
+    so the app starts accepting connections immediately. Returns the thread
+    so callers that need a fully seeded database can join it.
+    """
     init_db()
-    migrate_db()
-    seed()
-    seed_users()
-    seed_proposals()
+    worker = threading.Thread(target=_seed_all, name="db-seed", daemon=True)
+    worker.start()
+    return worker
 
-_startup()
+
+@app.cli.command("seed")
+def seed_command():
+    """Create the schema, run migrations, and load the demo dataset."""
+    try:
+        init_db()
+    except sqlite3.DatabaseError as exc:
+        raise SystemExit(f"Database initialisation failed: {exc}") from exc
+    _seed_all()
+    print("Database initialised and seeded.")
 
 # ---------------------------------------------------------------------------
 # Entry point (local development only — production uses gunicorn)
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
+    # The werkzeug reloader re-runs this script in a child process with
+    # WERKZEUG_RUN_MAIN set; only the first run does database work.
+    if os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        _startup()
     print(f"Starting Thesis Workflow Manager on http://127.0.0.1:{port}")
     app.run(debug=True, host="0.0.0.0", port=port)